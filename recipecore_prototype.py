@@ -1,12 +1,23 @@
 import tkinter as tk
 from tkinter import messagebox, scrolledtext
 import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
 from recipe_scrapers import scrape_me, scrape_html, WebsiteNotImplementedError
 import os
 import sys
 import subprocess
 import re
+import json
+import math
+import textwrap
+import atexit
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from html import unescape
+from urllib.parse import urlsplit
 
 # ----------------------------------------------------------------------
 # RecipeCore Prototype – HCI Assignment
@@ -16,7 +27,7 @@ from datetime import datetime
 #             instructions) without blog stories/ads.
 #
 # HCI alignment:
-#  -Visibility of system status: loading message + colored feedback
+#  -Visibility of system status: status line + colored feedback
 #  -Error prevention: try/except blocks + safe method checks
 #  -User control: real-time input → instant output which can reused and edited for whatever purpose the user desires - stimulation of creativity for their own modified recipe identity.
 #  -Aesthetic & minimalist design: clean dark theme, no clutter and typographic hierarchy for improved readablility! - to embrace evocation and reusability.
@@ -30,7 +41,7 @@ from datetime import datetime
 #   - Supports user edits: saves exactly what’s in the text area (including title changes)
 #
 # Dependencies:
-#   pip install recipe-scrapers requests
+#   pip install recipe-scrapers requests requests-cache
 #
 # To run:
 #   python3 recipecore_prototype.py
@@ -50,121 +61,494 @@ ACCENT_HOVER   = "#E0A07F"      # Button hover state
 SUCCESS        = "#A3BE8C"      # Green for success/fallback notes
 ERROR          = "#BF616A"      # Red for error/warning messages
 
-def summarize_recipe():
+# ────────────────────────────────────────────────
+# HTTP SESSION
+# ────────────────────────────────────────────────
+# Largest page body the fallback path will download (bytes)
+MAX_BYTES = 2_000_000
+
+# How long fallback pages stay in the on-disk cache (seconds)
+CACHE_EXPIRE_AFTER = 86400
+TOO_LARGE_MSG = f"Page is too large to summarize (over {MAX_BYTES // 1_000_000} MB).\nTry another URL.\n"
+
+
+def _declared_size(response):
+    """Content-Length of a response as an int, or None if missing/bogus."""
+    try:
+        return int(response.headers["Content-Length"])
+    except (KeyError, ValueError):
+        return None
+
+
+def _never_auto_cache(response):
     """
-    Main function called when user clicks the "Summarize" button.
-    1. Gets URL from entry field
-    2. Tries site-specific scraper first
-    3. Falls back to raw schema.org parsing if needed
-    4. Builds clean 3-paragraph output for the provided recipe/blog URL
+    requests-cache filter that keeps it from storing responses on its own.
+    Storing reads (and decompresses) the whole body before _fetch_scraper
+    sees a byte, which would defeat the MAX_BYTES cap – Content-Length is the
+    compressed size, so even a "small" gzip page can expand without limit.
+    Pages are saved by _store_page() instead, once the capped read is done.
     """
-    url = url_entry.get().strip()
-    if not url:
-        messagebox.showwarning("Input Error", "Please enter a recipe URL.")
-        return
+    return False
 
-    # Auto-prefix https:// if user forgot protocol (common mistake)
-    if not url.startswith(('http://', 'https://')):
-        url = 'https://' + url
 
-    # Clear previous output and show loading message
-    output_text.delete(1.0, tk.END)
-    output_text.insert(tk.END, "Fetching and summarizing recipe...\n\n")
-    window.update_idletasks()  # Force UI to refresh immediately
+def _store_page(response, body):
+    """
+    Save a fully read, size-capped fallback page to the disk cache. The body
+    is attached as the response content so requests-cache stores exactly the
+    bytes already read instead of touching the stream again. Best effort: a
+    cache write failure never stops the summary.
+    """
+    try:
+        response._content = bytes(body)
+        SESSION.cache.save_response(response, expires=requests_cache.get_expiration_datetime(CACHE_EXPIRE_AFTER))
+    except Exception:
+        pass
+
+
+# One shared session so repeat fetches reuse the same TCP/TLS connection
+# (keep-alive) instead of doing a fresh handshake on every click.
+# Fallback pages are also cached on disk (SQLite, 24h, in the user's cache
+# directory rather than wherever the app was launched) so re-summarizing a
+# page you just looked at never touches the network
+SESSION = requests_cache.CachedSession("recipecore_cache", backend="sqlite", use_cache_dir=True,
+                                       expire_after=CACHE_EXPIRE_AFTER, filter_fn=_never_auto_cache)
+SESSION.headers.update({"User-Agent": "Mozilla/5.0 RecipeCore HCI Prototype"})
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
+atexit.register(SESSION.close)
+
+# Worker threads for fetching/parsing so the Tk event loop never blocks
+_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
+# Scraper time getters to try, in display order: (method name, label)
+TIME_METHODS = (
+    ('total_time', "Total"),
+    ('preptime',   "Prep"),
+    ('cooktime',   "Cook"),
+)
+
+# True while a scrape is in flight (list so callbacks can flip it in place)
+_busy = [False]
+
+# Set once the window is closing; late scrape results are then dropped
+_closing = [False]
+
+# Filename cleanup patterns for save_and_open (compiled once at import)
+_TITLE_STRIP = re.compile(r'[^\w\s-]')
+_WS          = re.compile(r'\s+')
+
+# A scheme at the very start of user input ("https://", "ftp://", ...)
+_URL_SCHEME = re.compile(r'[a-z][a-z0-9+.-]*://', re.I)
+
+# Fallback fast path: schema.org JSON-LD blocks, matched on the raw page bytes
+_LDJSON_RE    = re.compile(rb'<script[^>]+application/ld\+json[^>]*>(.*?)</script>', re.S | re.I)
+_ISO_DURATION = re.compile(r'P(?:(\d+(?:\.\d+)?)D)?(?:T(?:(\d+(?:\.\d+)?)H)?(?:(\d+(?:\.\d+)?)M)?(?:(\d+(?:\.\d+)?)S)?)?', re.I)
+_HTML_TAG     = re.compile(r'<[^>]+>')
+
+# Max entries kept by each of the in-memory caches below
+SCRAPER_CACHE_SIZE  = 32
+
+# Finished fallback-path summaries keyed by URL: list of (text, tag) chunks
+# ready to re-insert. Site-specific scrapers are cached whole in
+# _SCRAPER_CACHE instead, and re-rendering one costs no network or parsing.
+# (only touched on the Tk thread, so no lock needed)
+_SUMMARY_CACHE = OrderedDict()
+
+# Most recently used scrape_me() results keyed by URL (see _get_scraper)
+_SCRAPER_CACHE      = OrderedDict()
+_SCRAPER_CACHE_LOCK = threading.Lock()
+
 
-    scraper = None
+def _insert_chunks(chunks):
+    """Insert a list of (text, tag) chunks at the end of the output area."""
+    if chunks:
+        # Tk's insert takes alternating text/tag pairs → one Tcl call in total
+        output_text.insert(tk.END, *(part for chunk in chunks for part in chunk))
+
+
+def _nonblank(text):
+    """Yield the stripped, non-empty lines of text one at a time."""
+    return (s for s in map(str.strip, text.splitlines()) if s)
+
+
+def _cached_scraper(url):
+    """Return the cached scrape_me() result for url (marking it recent), or None."""
+    with _SCRAPER_CACHE_LOCK:
+        if url in _SCRAPER_CACHE:
+            _SCRAPER_CACHE.move_to_end(url)
+            return _SCRAPER_CACHE[url]
+    return None
+
+
+def _get_scraper(url):
+    """
+    scrape_me() with a small LRU cache in front, so re-summarizing a URL
+    skips both the download and the HTML parse. Exceptions are not cached.
+    """
+    scraper = _cached_scraper(url)
+    if scraper is not None:
+        return scraper
+
+    scraper = scrape_me(url, timeout=12)  # bounded, so closing never waits forever
+
+    with _SCRAPER_CACHE_LOCK:
+        _SCRAPER_CACHE[url] = scraper
+        if len(_SCRAPER_CACHE) > SCRAPER_CACHE_SIZE:
+            _SCRAPER_CACHE.popitem(last=False)  # drop least recently used
+    return scraper
+
+
+def _warm_up():
+    """
+    Throwaway parse of an empty page so recipe_scrapers' HTML/schema.org
+    parsing machinery is loaded before the first real click. Runs in a
+    background thread at startup; any failure here is irrelevant.
+    """
+    try:
+        scrape_html(html="<html></html>", org_url="https://www.allrecipes.com/")
+    except Exception:
+        pass
+
+
+def _normalize(text):
+    """
+    Plain-text version of a JSON-LD string value: entities decoded, any
+    markup (<p>, &lt;br&gt;, ...) dropped, whitespace collapsed – the same
+    clean-up recipe_scrapers' normalize_string gives scrape_html results.
+    """
+    text = _HTML_TAG.sub(' ', unescape(str(text)))
+    return _WS.sub(' ', text).strip()
+
+
+class _JsonLdRecipe:
+    """
+    Minimal stand-in for a recipe_scrapers scraper, built straight from a
+    schema.org Recipe JSON-LD object. Only the getters _show_summary uses.
+    """
+
+    def __init__(self, data):
+        self._data = data
+
+    def _text(self, key):
+        value = self._data.get(key)
+        if isinstance(value, list):
+            value = value[0] if value else None
+        if isinstance(value, dict):  # e.g. {"@value": "..."}
+            value = value.get("@value", value.get("text"))
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            value = str(value)  # numeric recipeYield
+        if not isinstance(value, str):
+            return None  # unreadable → treat as missing
+        return _normalize(value) or None
+
+    def _minutes(self, key):
+        match = _ISO_DURATION.fullmatch(self._text(key) or "")
+        if not match or not any(match.groups()):
+            return None
+        days, hours, minutes, seconds = (float(g or 0) for g in match.groups())
+        # Whole minutes, rounding leftover seconds up (PT30S → 1 min)
+        return math.ceil(days * 1440 + hours * 60 + minutes + seconds / 60)
+
+    def title(self):
+        return self._text("name")
+
+    def yields(self):
+        value = self._text("recipeYield")
+        return f"{value} servings" if value and value.isdigit() else value
+
+    def description(self):
+        return self._text("description")
+
+    def total_time(self):
+        return self._minutes("totalTime")
+
+    def preptime(self):
+        return self._minutes("prepTime")
+
+    def cooktime(self):
+        return self._minutes("cookTime")
+
+    def ingredients(self):
+        items = self._data.get("recipeIngredient") or self._data.get("ingredients") or []
+        if isinstance(items, str):
+            items = [items]
+        return [_normalize(item) for item in items if isinstance(item, str)]
+
+    def instructions(self):
+        steps = []
+
+        def collect(node):
+            if isinstance(node, str):
+                # A plain string may hold several steps, one per line
+                steps.extend(line for line in map(_normalize, node.splitlines()) if line)
+            elif isinstance(node, list):
+                for child in node:
+                    collect(child)
+            elif isinstance(node, dict):
+                # HowToSection nests its steps; HowToStep carries "text"
+                if "itemListElement" in node:
+                    collect(node["itemListElement"])
+                elif isinstance(node.get("text"), str):
+                    steps.append(_normalize(node["text"]))
+
+        collect(self._data.get("recipeInstructions"))
+        return "\n".join(steps)
+
+
+def _find_ldjson_recipe(html_bytes):
+    """
+    Look for a schema.org Recipe in the page's JSON-LD blocks without building
+    a DOM. Returns a _JsonLdRecipe, or None if there isn't a usable one.
+    """
+    for match in _LDJSON_RE.finditer(html_bytes):
+        try:
+            data = json.loads(match.group(1))
+        except ValueError:
+            continue
+
+        # Recipes can sit at the top level, in a list, or inside "@graph"
+        candidates = data if isinstance(data, list) else [data]
+        for node in list(candidates):
+            if isinstance(node, dict) and isinstance(node.get("@graph"), list):
+                candidates.extend(node["@graph"])
+
+        for node in candidates:
+            if not isinstance(node, dict):
+                continue
+            types = node.get("@type")
+            types = types if isinstance(types, list) else [types]
+            if "Recipe" in types:
+                recipe = _JsonLdRecipe(node)
+                if recipe.title():  # no readable name → let scrape_html try
+                    return recipe
+    return None
+
+
+def _fetch_scraper(url, refresh=False):
+    """
+    Network + HTML parsing for one URL. Runs in a worker thread, so it must
+    never touch Tk widgets – results and error text are handed back instead.
+    refresh=True bypasses the on-disk HTTP cache for the fallback fetch.
+    Returns (scraper, fallback_used, error_message).
+    """
     fallback_used = False
 
     # ── Step 1: Try preferred site-specific scraper ─────────────────────
     try:
-        scraper = scrape_me(url)
+        return _get_scraper(url), fallback_used, None
     except WebsiteNotImplementedError:
         # Site not fully supported → go to fallback
         fallback_used = True
         try:
-            headers = {"User-Agent": "Mozilla/5.0 RecipeCore HCI Prototype"}
-            response = requests.get(url, headers=headers, timeout=12)
-            response.raise_for_status()  # Raise if HTTP error (404, etc.)
-            scraper = scrape_html(html=response.text, org_url=url)
-            output_text.insert(tk.END, "Note: Using fallback schema.org parsing (may miss some details).\n\n", "note")
+            # Stream the body and stop reading past MAX_BYTES so huge pages
+            # can't balloon memory or stall the worker. iter_content yields
+            # decompressed bytes, so the cap holds for gzip/br pages too
+            with SESSION.get(url, timeout=12, stream=True, force_refresh=refresh) as response:
+                response.raise_for_status()  # Raise if HTTP error (404, etc.)
+                size = _declared_size(response)
+                if size is not None and size > MAX_BYTES:
+                    return None, fallback_used, TOO_LARGE_MSG
+                body = bytearray()
+                for block in response.iter_content(chunk_size=64 * 1024):
+                    body += block
+                    if len(body) > MAX_BYTES:
+                        return None, fallback_used, TOO_LARGE_MSG
+                encoding = response.encoding or "utf-8"
+                # Cache by the real (capped) length, chunked responses included
+                if not getattr(response, "from_cache", False):
+                    _store_page(response, body)
+
+            # Cheap path first: read the JSON-LD recipe straight from the bytes
+            recipe = _find_ldjson_recipe(bytes(body))
+            if recipe is not None:
+                return recipe, fallback_used, None
+
+            html = body.decode(encoding, errors="replace")
+            return scrape_html(html=html, org_url=url), fallback_used, None
         except requests.RequestException as req_err:
-            output_text.insert(tk.END, f"Could not load page: {str(req_err)}\nTry another URL.\n", "error")
-            return
+            return None, fallback_used, f"Could not load page: {str(req_err)}\nTry another URL.\n"
         except Exception as fb_err:
-            output_text.insert(tk.END, f"Fallback failed: {str(fb_err)}\n", "error")
-            return
+            return None, fallback_used, f"Fallback failed: {str(fb_err)}\n"
     except Exception as e:
-        output_text.insert(tk.END, f"Parsing error: {str(e)}\nTry a different recipe site.\n", "error")
+        return None, fallback_used, f"Parsing error: {str(e)}\nTry a different recipe site.\n"
+
+
+def summarize_recipe(refresh=False):
+    """
+    Main function called when user clicks the "Summarize" button.
+    1. Gets URL from entry field
+    2. Hands fetching/parsing to a worker thread so the window stays responsive
+    3. _render() builds the output back on the Tk thread once it's done
+    Shift-click passes refresh=True to drop any cached result for the URL first.
+    """
+    # Ignore clicks while a scrape is already running
+    if _busy[0]:
+        return
+
+    url = url_entry.get().strip()
+    if not url:
+        messagebox.showwarning("Input Error", "Please enter a recipe URL.")
+        return
+
+    # Auto-prefix https:// if user forgot protocol (common mistake), then
+    # reject anything without a host before it can hit the network
+    if not _URL_SCHEME.match(url):
+        url = 'https://' + url
+    try:
+        parts = urlsplit(url)
+    except ValueError:  # e.g. "https://[bad"
+        parts = None
+    if parts is None or parts.scheme not in ('http', 'https') or not parts.netloc:
+        messagebox.showwarning("Input Error", "That doesn't look like a valid web address.")
+        return
+    url = parts.geturl()
+
+    if refresh:
+        _SUMMARY_CACHE.pop(url, None)
+        with _SCRAPER_CACHE_LOCK:
+            _SCRAPER_CACHE.pop(url, None)
+
+    # Site-specific scraper already parsed → just render it again
+    scraper = _cached_scraper(url)
+    if scraper is not None:
+        _render(url, (scraper, False, None))
+        return
+
+    # Fallback page already summarized → show the cached result instantly
+    if url in _SUMMARY_CACHE:
+        _SUMMARY_CACHE.move_to_end(url)
+        output_text.delete(1.0, tk.END)
+        _insert_chunks(_SUMMARY_CACHE[url])
+        return
+
+    # Clear previous output and show progress in the status line
+    # (StringVar.set schedules its own repaint, no forced update needed)
+    output_text.delete(1.0, tk.END)
+    status_var.set("Fetching and summarizing recipe...")
+
+    # Disable the button until the result is rendered (no overlapping scrapes)
+    _busy[0] = True
+    summarize_btn.config(state=tk.DISABLED)
+    fut = _EXECUTOR.submit(_fetch_scraper, url, refresh)
+    fut.add_done_callback(lambda f: _on_scrape_done(url, f))
+
+
+def _on_scrape_done(url, fut):
+    """
+    Done-callback for a scrape future (runs on the worker thread). Hands the
+    result to the Tk thread, unless the window has been closed meanwhile.
+    """
+    if _closing[0] or fut.cancelled():
+        return
+    try:
+        window.after(0, _render, url, fut.result())
+    except (RuntimeError, tk.TclError):
+        pass  # window destroyed between the check and the call
+
+
+def _on_close():
+    """
+    WM_DELETE_WINDOW handler: drop queued scrapes and don't wait on the
+    running one, so the process exits with its window.
+    """
+    _closing[0] = True
+    _EXECUTOR.shutdown(wait=False, cancel_futures=True)
+    window.destroy()
+
+
+def _render(url, result):
+    """
+    Completion callback for a scrape. Always runs on the Tk thread (scheduled
+    via window.after) and re-enables the Summarize button however it ends.
+    """
+    try:
+        _show_summary(url, result)
+    finally:
+        _busy[0] = False
+        summarize_btn.config(state=tk.NORMAL)
+        status_var.set("")
+
+
+def _show_summary(url, result):
+    """
+    Builds the clean 3-paragraph output from a finished _fetch_scraper() call.
+    """
+    scraper, fallback_used, error_message = result
+
+    if error_message:
+        output_text.insert(tk.END, error_message, "error")
         return
 
     # ── Step 2: Build the clean 3-paragraph output ───────────────────────
+    chunks = []
     try:
-        # Clear loading message **just before** inserting real content
+        # Clear the output **just before** inserting real content
         # This ensures the first line is always the title
-        output_text.delete(1.0, tk.END)  # Remove loading text now that we have data
+        output_text.delete(1.0, tk.END)
 
         # Overview paragraph – title is first
         title = scraper.title() or "Recipe (title not found)"
         servings = scraper.yields() or "N/A"
 
-        # Allow full description (up to 600 chars) for richer notes section
+        # Allow full description (up to 600 chars) for richer notes section.
+        # Only long ones are touched: cut at a word boundary, or mid-word if
+        # the first word alone is too long (shorten would leave just "...")
         description = scraper.description() or "No description available."
         if len(description) > 600:
-            description = description[:597] + "..."
+            short = textwrap.shorten(description, width=600, placeholder="...")
+            description = short if short != "..." else description[:597] + "..."
 
         # Time extraction – very defensive to avoid AttributeError
         times = []
-        time_methods = [
-            ('total_time', "Total"),
-            ('preptime',   "Prep"),
-            ('cooktime',   "Cook")
-        ]
-
-        for method_name, label in time_methods:
-            if hasattr(scraper, method_name):
-                getter = getattr(scraper, method_name)
-                try:
-                    value = getter()
-                    if value is not None:
-                        if isinstance(value, (int, float)):
-                            times.append(f"{label}: {int(value)} min")
-                        else:
-                            times.append(f"{label}: {value}")
-                except (TypeError, ValueError):
-                    pass
+        for method_name, label in TIME_METHODS:
+            getter = getattr(scraper, method_name, None)
+            if getter is None:
+                continue
+            try:
+                value = getter()
+            except (TypeError, ValueError, AttributeError):
+                continue
+            if value is not None:
+                if isinstance(value, (int, float)):
+                    times.append(f"{label}: {int(value)} min")
+                else:
+                    times.append(f"{label}: {value}")
 
         time_str = " | ".join(times) if times else "Times not available"
         if fallback_used and not times:
             time_str += " (check original page)"
 
         # Build overview with tagged sections
-        output_text.insert(tk.END, f"{title}\n\n", "title")
-        output_text.insert(tk.END, f"Servings: {servings}\n", "heading")
-        output_text.insert(tk.END, f"{time_str}\n", "heading")
-        output_text.insert(tk.END, f"Notes: {description}\n\n", "heading")
+        chunks.append((f"{title}\n\n", "title"))
+        chunks.append((f"Servings: {servings}\n", "heading"))
+        chunks.append((f"{time_str}\n", "heading"))
+        chunks.append((f"Notes: {description}\n\n", "heading"))
 
         # Ingredients paragraph
-        ing_list = scraper.ingredients()
+        # Strip once up front; blank entries are dropped
+        ing_list = [s for s in map(str.strip, scraper.ingredients() or ()) if s]
         if ing_list:
-            output_text.insert(tk.END, "Ingredients:\n", "heading")
-            for item in ing_list:
-                output_text.insert(tk.END, f"• {item.strip()}\n", "body")
-            output_text.insert(tk.END, "\n")
+            chunks.append(("Ingredients:\n", "heading"))
+            chunks.append(("".join(f"• {item}\n" for item in ing_list) + "\n", "body"))
         else:
-            output_text.insert(tk.END, "Ingredients: (not found)\n\n", "heading")
+            chunks.append(("Ingredients: (not found)\n\n", "heading"))
 
         # Instructions paragraph
         instr_text = scraper.instructions()
         if instr_text:
-            output_text.insert(tk.END, "Instructions:\n", "heading")
-            steps = [s.strip() for s in instr_text.splitlines() if s.strip()]
-            for i, step in enumerate(steps, 1):
-                output_text.insert(tk.END, f"{i}. {step}\n", "body")
-            output_text.insert(tk.END, "\n")
+            chunks.append(("Instructions:\n", "heading"))
+            body = "".join(f"{i}. {step}\n" for i, step in enumerate(_nonblank(instr_text), 1))
+            chunks.append((body + "\n", "body"))
         else:
-            output_text.insert(tk.END, "Instructions: (not extracted – see original site)\n", "heading")
+            chunks.append(("Instructions: (not extracted – see original site)\n", "heading"))
+
+        _insert_chunks(chunks)
+        if fallback_used:  # site-specific results already live in _SCRAPER_CACHE
+            _SUMMARY_CACHE[url] = chunks
+            if len(_SUMMARY_CACHE) > SCRAPER_CACHE_SIZE:
+                _SUMMARY_CACHE.popitem(last=False)  # drop least recently used
 
     except Exception as parse_err:
+        _insert_chunks(chunks)
         output_text.insert(tk.END, f"\nUnexpected parsing issue: {str(parse_err)}\n"
                                   f"Partial data shown above.", "error")
 
@@ -175,21 +559,32 @@ def save_and_open():
     Opens the file with the default app for printing/editing.
     Adds timestamp if file already exists to avoid overwriting.
     """
-    text = output_text.get("1.0", tk.END).strip()
-
-    # Improved check: block only if it's basically still the loading state
-    loading_marker = "Fetching and summarizing recipe..."
-    if len(text) < 100 or (loading_marker in text and len(text.splitlines()) < 5):
+    # Improved check: block while a scrape is running or when the output is
+    # just an error message. Both tests ask Tk directly so the buffer is never
+    # copied into Python
+    char_count = (output_text.count("1.0", "end-1c", "chars") or (0,))[0]
+    only_error = "error" in output_text.tag_names("1.0")
+    if _busy[0] or char_count < 100 or only_error:
         messagebox.showwarning("Nothing to save", "Run a summary first.")
         return
 
-    # Extract title from the first non-empty line (user-editable)
-    lines = [line.strip() for line in text.splitlines() if line.strip()]
-    title = lines[0] if lines else "Recipe"
+    # Extract title from the first non-empty line (user-editable), reading
+    # one display line at a time instead of splitting the whole buffer
+    last_line = int(output_text.index("end-1c").split(".")[0])
+    title, first_line = "Recipe", 1
+    for i in range(1, last_line + 1):
+        line = output_text.get(f"{i}.0", f"{i}.end").strip()
+        if line:
+            title, first_line = line, i
+            break
+
+    # ...and the last non-empty line, so trailing blank lines aren't saved
+    while last_line > first_line and not output_text.get(f"{last_line}.0", f"{last_line}.end").strip():
+        last_line -= 1
 
     # Clean title for filename: remove invalid chars, replace spaces
-    clean_title = re.sub(r'[^\w\s-]', '', title)      # remove special chars
-    clean_title = re.sub(r'\s+', '_', clean_title)    # spaces → underscores
+    clean_title = _TITLE_STRIP.sub('', title)         # remove special chars
+    clean_title = _WS.sub('_', clean_title)           # spaces → underscores
     clean_title = clean_title.strip('_')              # trim extra _
 
     if not clean_title:
@@ -207,17 +602,28 @@ def save_and_open():
         with open(file_path, "w", encoding="utf-8") as f:
             f.write(f"RecipeCore Summary – {title}\n" + "="*50 + "\n\n")
             f.write(f"Source URL: {url_entry.get().strip()}\n\n")
-            f.write(text)
-
-        # Open file with default application (cross-platform)
+            # Stream the summary line by line straight from the widget,
+            # trimmed at both ends like the old text.strip()
+            for i in range(first_line, last_line + 1):
+                line = output_text.get(f"{i}.0", f"{i}.end")
+                if i == first_line:
+                    line = line.lstrip()
+                if i == last_line:
+                    f.write(line.rstrip())
+                else:
+                    f.write(line + "\n")
+
+        # Open file with default application (cross-platform).
+        # Popen/startfile return immediately, so the UI never waits on the opener
         if sys.platform == "darwin":  # macOS
-            subprocess.run(['open', file_path])
+            subprocess.Popen(['open', file_path], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         elif sys.platform == "win32":
             os.startfile(file_path)
         else:  # Linux
-            subprocess.run(['xdg-open', file_path])
+            subprocess.Popen(['xdg-open', file_path], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
-        messagebox.showinfo("Saved & Opened", f"Saved as:\n{file_path}\nOpened in default app (TextEdit on Mac) for printing/editing.")
+        window.after(0, messagebox.showinfo, "Saved & Opened",
+                     f"Saved as:\n{file_path}\nOpened in default app (TextEdit on Mac) for printing/editing.")
     except Exception as e:
         messagebox.showerror("Save Error", f"Could not save/open file:\n{str(e)}")
 
@@ -265,7 +671,7 @@ url_entry = tk.Entry(
 url_entry.pack(pady=5, padx=20)
 
 # ── Summarize button ────────────────────────────────────────────────────
-tk.Button(
+summarize_btn = tk.Button(
     window,
     text="Get Clean 3-Paragraph Summary",
     command=summarize_recipe,
@@ -278,7 +684,11 @@ tk.Button(
     pady=8,
     relief="flat",
     borderwidth=0
-).pack(pady=10)
+)
+summarize_btn.pack(pady=10)
+# Shift-click = refresh: ignore cached results and scrape the page again.
+# "break" stops the normal click handler so the command doesn't run twice
+summarize_btn.bind("<Shift-Button-1>", lambda e: (summarize_recipe(refresh=True), "break")[1])
 
 # ── Save & Open for Print button ───────────────────────────────────────
 tk.Button(
@@ -296,6 +706,16 @@ tk.Button(
     borderwidth=0
 ).pack(pady=5)
 
+# ── Status line (progress while a scrape runs) ──────────────────────────
+status_var = tk.StringVar(value="")
+tk.Label(
+    window,
+    textvariable=status_var,
+    font=("Helvetica", 10, "italic"),
+    bg=BG_MAIN,
+    fg=TEXT_SECONDARY
+).pack()
+
 # ── Scrollable output area with 1.5× line spacing ───────────────────────
 output_text = scrolledtext.ScrolledText(
     window,
@@ -328,5 +748,11 @@ output_text.insert(tk.END, "Compatible with many recipe blogs such as, but not l
                           "• foodnetwork.com\n\n", "note")
 output_text.insert(tk.END, "Recipes provided without the extra unneeded details!\n\n")
 
+# Closing the window mid-scrape must not leave the process hanging around
+window.protocol("WM_DELETE_WINDOW", _on_close)
+
+# Warm up the scraper library while the user is still pasting a URL
+threading.Thread(target=_warm_up, daemon=True).start()
+
 # Start the Tkinter event loop
 window.mainloop()
\ No newline at end of file